@@ -1,15 +1,121 @@
 """Classes and methods for connecting to REDCap via API."""
 
 import json
+from functools import lru_cache
 from json import JSONDecodeError
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 
 import requests  # type: ignore
 from ratelimit import limits, sleep_and_retry
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from redcap_api.redcap_parameter_store import REDCapParameters, REDCapReportParameters
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional C-accelerated decoder
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover - optional typed decoder
+    msgspec = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=None)
+def _record_list_decoder(record_type: type) -> Any:
+    """Returns a msgspec decoder for a list of the given record type.
+
+    Decoders are cached per record type since construction compiles the
+    schema.
+
+    Args:
+      record_type: the msgspec.Struct type for a record
+    """
+    return msgspec.json.Decoder(list[record_type])  # type: ignore[valid-type]
+
+
+def json_loads(content: bytes) -> Any:
+    """Decodes a JSON response body, using orjson when available.
+
+    orjson decodes directly from bytes, avoiding the extra UTF-8 decode
+    pass done by ``Response.json``.
+
+    Args:
+      content: the response body as bytes
+
+    Returns:
+      The object for the JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def json_dumps(value: Any) -> str:
+    """Serializes a value to a JSON string, using orjson when available.
+
+    Args:
+      value: the object to serialize
+
+    Returns:
+      The JSON string for the value.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+
+    return json.dumps(value)
+
+
+def json_dumps_bytes(value: Any) -> bytes:
+    """Serializes a value to JSON bytes, using orjson when available.
+
+    orjson returns bytes natively, skipping the str to bytes encode
+    needed with the stdlib encoder.
+
+    Args:
+      value: the object to serialize
+
+    Returns:
+      The JSON bytes for the value.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+
+    return json.dumps(value).encode("utf-8")
+
+
+def create_session() -> requests.Session:
+    """Creates a requests session with keep-alive connection pooling.
+
+    Reusing a session amortizes the TCP and TLS handshake across the
+    API calls made on the connection.
+
+    Returns:
+      the configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Static request payloads shared across calls; post_request merges the
+# token and formats into a fresh dict, so these are never mutated.
+_FIELD_NAMES_PAYLOAD = {"content": "exportFieldNames"}
+_PROJECT_INFO_PAYLOAD = {"content": "project"}
+_REPORT_PAYLOAD = {
+    "content": "report",
+    "csvDelimiter": "",
+    "rawOrLabel": "raw",
+    "rawOrLabelHeaders": "raw",
+    "exportCheckboxLabel": "false",
+}
+
 
 class REDCapSuperUserConnection:
     """REDCap connection using super API token.
@@ -18,6 +124,8 @@ class REDCapSuperUserConnection:
     for super token.
     """
 
+    __slots__ = ("__session", "__token", "__url")
+
     def __init__(self, *, token: str, url: str) -> None:
         """Initializes a REDCap connection using the super API token and URL.
 
@@ -27,12 +135,23 @@ class REDCapSuperUserConnection:
         """
         self.__token = token
         self.__url = url
+        self.__session = create_session()
 
     @property
     def url(self) -> str:
         """REDCap API URL."""
         return self.__url
 
+    def close(self) -> None:
+        """Closes the underlying session and its pooled connections."""
+        self.__session.close()
+
+    def __enter__(self) -> "REDCapSuperUserConnection":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     @classmethod
     def create_from(cls, parameters: REDCapParameters) -> "REDCapSuperUserConnection":
         """Creates a REDCap connection with given parameters.
@@ -67,7 +186,7 @@ class REDCapSuperUserConnection:
           REDCapConnectionError if the response has an error
         """
         properties = {"project_title": title, "purpose": purpose}
-        data = json.dumps([properties])
+        data = json_dumps([properties])
 
         fields = {
             "token": self.__token,
@@ -79,7 +198,7 @@ class REDCapSuperUserConnection:
             fields["odm"] = project_xml
 
         try:
-            response = requests.post(self.__url, data=fields)
+            response = self.__session.post(self.__url, data=fields)
         except (
             requests.exceptions.SSLError,
             requests.exceptions.ConnectionError,
@@ -103,6 +222,8 @@ class REDCapConnection:
     `REDCapReportConnection`
     """
 
+    __slots__ = ("__session", "__token", "__url")
+
     def __init__(self, *, token: str, url: str) -> None:
         """Initializes a REDCap connection using the given project token and
         URL.
@@ -113,6 +234,17 @@ class REDCapConnection:
         """
         self.__token = token
         self.__url = url
+        self.__session = create_session()
+
+    def close(self) -> None:
+        """Closes the underlying session and its pooled connections."""
+        self.__session.close()
+
+    def __enter__(self) -> "REDCapConnection":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     @classmethod
     def create_from(cls, parameters: REDCapParameters) -> "REDCapConnection":
@@ -131,12 +263,20 @@ class REDCapConnection:
     def post_request(
         self,
         *,
-        data: Dict[str, str],
+        data: Dict[str, Any],
         result_format: Optional[str] = None,
         error_format: str = "json",
+        stream: bool = False,
     ) -> Any:
         """Posts a request to the REDCap project with the given data object.
 
+        Args:
+          data: the request fields
+          result_format: the format for the result, if any
+          error_format: the format for any error response
+          stream: whether to stream the response body instead of
+            downloading it eagerly
+
         Returns:
           The response from posting the request.
 
@@ -144,11 +284,22 @@ class REDCapConnection:
           REDCapConnectionError if there is an error connecting to the
           specified project
         """
-        data.update({"token": self.__token, "returnFormat": error_format})
+        # merge rather than update so shared payload templates are not
+        # mutated with the token
+        payload = {**data, "token": self.__token, "returnFormat": error_format}
         if result_format:
-            data["format"] = result_format
+            payload["format"] = result_format
+
+        # pre-encode the form body in one C-level pass instead of having
+        # requests urlencode the dict per call
+        body = urlencode(payload).encode("utf-8")
         try:
-            response = requests.post(self.__url, data=data)
+            response = self.__session.post(
+                self.__url,
+                data=body,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                stream=stream,
+            )
         except (
             requests.exceptions.SSLError,
             requests.exceptions.ConnectionError,
@@ -161,10 +312,26 @@ class REDCapConnection:
 
     @sleep_and_retry
     @limits(calls=20, period=1)
-    def request_json_value(self, *, data: Dict[str, str], message: str) -> Any:
+    def request_json_value(
+        self,
+        *,
+        data: Dict[str, str],
+        message: str,
+        record_type: Optional[type] = None,
+    ) -> Any:
         """Posts a request to the REDCap project with the given data object
         expecting a JSON value.
 
+        When a record_type (a msgspec.Struct subclass) is given and
+        msgspec is installed, the response is decoded as a list of that
+        type with a schema-compiled decoder, which skips the per-record
+        dict allocation of the generic decode.
+
+        Args:
+          data: the request fields
+          message: the error message context
+          record_type: optional msgspec.Struct type for the records
+
         Returns:
           The object for the JSON value.
 
@@ -176,8 +343,15 @@ class REDCapConnection:
             raise REDCapConnectionError(
                 message=error_message(message=message, response=response)
             )
+
+        if record_type is not None and msgspec is not None:
+            try:
+                return _record_list_decoder(record_type).decode(response.content)
+            except msgspec.DecodeError as error:
+                raise REDCapConnectionError(message=message) from error
+
         try:
-            return response.json()
+            return json_loads(response.content)
         except JSONDecodeError as error:
             raise REDCapConnectionError(message=message) from error
 
@@ -214,11 +388,8 @@ class REDCapConnection:
         """
 
         message = "exporting list of field names"
-        data = {
-            "content": "exportFieldNames",
-        }
 
-        return self.request_json_value(data=data, message=message)
+        return self.request_json_value(data=_FIELD_NAMES_PAYLOAD, message=message)
 
     def export_project_info(self) -> Dict[str, Any]:
         """Export the basic attributes of the project.
@@ -231,17 +402,19 @@ class REDCapConnection:
         """
 
         message = "exporting project info"
-        data = {"content": "project"}
 
-        return self.request_json_value(data=data, message=message)
+        return self.request_json_value(data=_PROJECT_INFO_PAYLOAD, message=message)
 
 
 class REDCapReportConnection(REDCapConnection):
     """Defines a REDCap connection meant for reading a particular report."""
 
+    __slots__ = ("__report_records", "report_id")
+
     def __init__(self, *, token: str, url: str, report_id: str) -> None:
         super().__init__(token=token, url=url)
         self.report_id = report_id
+        self.__report_records: Optional[List[Dict[str, str]]] = None
 
     @classmethod
     def create_from(
@@ -268,26 +441,38 @@ class REDCapReportConnection(REDCapConnection):
           list of records from the report
         """
         message = f"pulling report id {self.report_id}"
-        data = {
-            "content": "report",
-            "report_id": str(self.report_id),
-            "csvDelimiter": "",
-            "rawOrLabel": "raw",
-            "rawOrLabelHeaders": "raw",
-            "exportCheckboxLabel": "false",
-        }
+        data = {**_REPORT_PAYLOAD, "report_id": str(self.report_id)}
         return self.request_json_value(data=data, message=message)
 
+    @property
+    def report_records(self) -> List[Dict[str, str]]:
+        """The records for the report, fetched once per connection.
+
+        The report for a connection is stable over a short run, so the
+        first access pulls the report and later accesses reuse the
+        parsed records. Use `get_report_records` to force a refetch.
+
+        Returns:
+          list of records from the report
+        """
+        if self.__report_records is None:
+            self.__report_records = self.get_report_records()
+
+        return self.__report_records
+
 
 def error_message(*, message: str, response: Response) -> str:
     """Build an error message from the given message and HTTP response.
 
+    Only the first 2KB of the response body is decoded, which is plenty
+    for diagnostics and avoids decoding large HTML error pages.
+
     Returns:
       The error string
     """
+    body = response.content[:2048].decode("utf-8", errors="replace")
     return (
-        f"Error: {message}\nHTTP Error:{response.status_code} "
-        f"{response.reason}: {response.text}"
+        f"Error: {message}\nHTTP Error:{response.status_code} {response.reason}: {body}"
     )
 
 
@@ -0,0 +1,68 @@
+"""Module to represent an email list pulled from a REDCap report."""
+
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+from redcap_api.redcap_connection import REDCapReportConnection
+
+
+class REDCapEmailList:
+    """Class representing an email list managed in a REDCap report.
+
+    Maps each email address in the report to its full record.
+    """
+
+    __slots__ = ("__email_key", "__email_list", "__email_list_view", "__redcap_con")
+
+    def __init__(
+        self, *, redcap_con: REDCapReportConnection, email_key: str = "email"
+    ) -> None:
+        """Initializes the email list from the report for the connection.
+
+        Args:
+          redcap_con: the connection for the REDCap report
+          email_key: the report field holding the email address
+
+        Raises:
+          REDCapEmailListError if the report has duplicate email addresses
+        """
+        self.__redcap_con = redcap_con
+        self.__email_key = email_key
+        self.__email_list = self.__pull_email_list_from_redcap()
+        self.__email_list_view = MappingProxyType(self.__email_list)
+
+    @property
+    def email_list(self) -> Mapping[str, Dict[str, str]]:
+        """A read-only view of the map from email address to report record.
+
+        The view shares the underlying dict, so callers can iterate it
+        without making a defensive copy.
+        """
+        return self.__email_list_view
+
+    def __pull_email_list_from_redcap(self) -> Dict[str, Dict[str, str]]:
+        """Pulls the report records and builds the email map in one pass.
+
+        Uses dict.setdefault so each record costs a single dict operation
+        instead of a membership check followed by an insert.
+
+        Returns:
+          the map from email address to report record
+
+        Raises:
+          REDCapEmailListError if the report has duplicate email addresses
+        """
+        records = self.__redcap_con.report_records
+
+        email_list: Dict[str, Dict[str, str]] = {}
+        for record in records:
+            email = record[self.__email_key]
+            previous = email_list.setdefault(email, record)
+            if previous is not record:
+                raise REDCapEmailListError(f"Duplicate email: {email}")
+
+        return email_list
+
+
+class REDCapEmailListError(Exception):
+    """Exception class representing an error building a REDCap email list."""
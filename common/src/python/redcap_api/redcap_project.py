@@ -1,19 +1,81 @@
 """Module to represent a REDCap project and associated API calls."""
 
-import json
+import itertools
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from json import JSONDecodeError
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from redcap_api.redcap_connection import (
     REDCapConnection,
     REDCapConnectionError,
     error_message,
+    json_dumps,
+    json_dumps_bytes,
+    json_loads,
 )
 
+try:
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover - optional streaming decoder
+    ijson = None  # type: ignore[assignment]
+
 log = logging.getLogger()
 
 
+# Largest number of record IDs sent in a single export request; larger
+# ID lists are split to keep request bodies within REDCap's limits.
+_RECORD_ID_CHUNK_SIZE = 500
+
+
+def _chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yields successive chunks of at most size items.
+
+    Args:
+        items: the list to chunk
+        size: the maximum chunk length
+    """
+    for index in range(0, len(items), size):
+        yield items[index : index + size]
+
+
+# Static request payloads shared across calls; post_request merges the
+# token and formats into a fresh dict, so these are never mutated.
+_INSTRUMENTS_PAYLOAD = {"content": "instrument"}
+_USER_ROLES_PAYLOAD = {"content": "userRole"}
+_USER_ROLE_MAPPING_PAYLOAD = {"content": "userRoleMapping"}
+_USERS_PAYLOAD = {"content": "user"}
+_EVENTS_PAYLOAD = {"content": "event"}
+
+
+# Static privileges granted to a NACC developer; built once at module
+# load and copied per call in get_nacc_developer_permissions.
+_DEVELOPER_PERMISSIONS_TEMPLATE = {
+    "design": 1,
+    "alerts": 1,
+    "user_rights": 1,
+    "data_access_groups": 1,
+    "data_export": 1,
+    "reports": 1,
+    "stats_and_charts": 1,
+    "manage_survey_participants": 1,
+    "calendar": 1,
+    "data_import_tool": 1,
+    "data_comparison_tool": 1,
+    "logging": 1,
+    "file_repository": 1,
+    "data_quality_create": 1,
+    "data_quality_execute": 1,
+    "api_export": 1,
+    "api_import": 1,
+    "record_create": 1,
+    "record_rename": 1,
+    "record_delete": 1,
+}
+
+
 class REDCapRoles:
     """Data class for storing REDCap roles."""
 
@@ -45,37 +107,16 @@ def get_nacc_developer_permissions(
 
     # Need to set permissions for each form in the project
     if forms_list:
-        for form in forms_list:
-            form_name = form["instrument_name"]
-            forms[form_name] = 1  # View and Edit
-            forms_export[form_name] = 1  # Full Data Set
+        form_names = [form["instrument_name"] for form in forms_list]
+        forms = dict.fromkeys(form_names, 1)  # View and Edit
+        forms_export = dict.fromkeys(form_names, 1)  # Full Data Set
 
-    permissions = {
+    permissions: Dict[str, Any] = {
         "username": username,
         "expiration": expiration,
-        "design": 1,
-        "alerts": 1,
-        "user_rights": 1,
-        "data_access_groups": 1,
-        "data_export": 1,
-        "reports": 1,
-        "stats_and_charts": 1,
-        "manage_survey_participants": 1,
-        "calendar": 1,
-        "data_import_tool": 1,
-        "data_comparison_tool": 1,
-        "logging": 1,
-        "file_repository": 1,
-        "data_quality_create": 1,
-        "data_quality_execute": 1,
-        "api_export": 1,
-        "api_import": 1,
-        "record_create": 1,
-        "record_rename": 1,
-        "record_delete": 1,
-        "forms": forms,
-        "forms_export": forms_export,
     }
+    permissions.update(_DEVELOPER_PERMISSIONS_TEMPLATE)
+    permissions.update(forms=forms, forms_export=forms_export)
 
     return permissions
 
@@ -83,6 +124,20 @@ def get_nacc_developer_permissions(
 class REDCapProject:
     """Class representing a REDCap project."""
 
+    __slots__ = (
+        "__event_names",
+        "__events",
+        "__instruments",
+        "__longitudinal",
+        "__pid",
+        "__pk_field",
+        "__redcap_con",
+        "__repeating_ins",
+        "__role_names",
+        "__title",
+        "__user_roles",
+    )
+
     def __init__(
         self,
         *,
@@ -99,6 +154,12 @@ class REDCapProject:
         self.__pk_field = pk_field
         self.__longitudinal = longitudinal
         self.__repeating_ins = repeating_ins
+        # caches for project metadata that is static per project lifetime
+        self.__instruments: Optional[List[Dict[str, str]]] = None
+        self.__user_roles: Optional[List[Dict[str, Any]]] = None
+        self.__events: Optional[List[Dict[str, Any]]] = None
+        self.__event_names: Optional[Dict[str, str]] = None
+        self.__role_names: Optional[Dict[str, str]] = None
 
     @classmethod
     def create(cls, redcap_con: REDCapConnection) -> "REDCapProject":
@@ -139,34 +200,79 @@ class REDCapProject:
         """Does this project has repeating instruments or events."""
         return self.__repeating_ins
 
+    def invalidate_metadata(self) -> None:
+        """Clears the cached project metadata.
+
+        Called after mutating calls so the next metadata export refetches
+        from REDCap.
+        """
+        self.__instruments = None
+        self.__user_roles = None
+        self.__events = None
+        self.__event_names = None
+        self.__role_names = None
+
     def export_instruments(self) -> List[Dict[str, str]]:
         """Export the list of instruments in the project.
 
+        The result is cached on the instance; call `invalidate_metadata`
+        to force a refetch.
+
         Returns:
             List containing the name and label for each instrument
 
         Raises:
           REDCapConnectionError if the response has an error
         """
+        if self.__instruments is not None:
+            return self.__instruments
 
         message = "exporting list of forms"
-        data = {"content": "instrument"}
 
-        return self.__redcap_con.request_json_value(data=data, message=message)
+        self.__instruments = self.__redcap_con.request_json_value(
+            data=_INSTRUMENTS_PAYLOAD, message=message
+        )
+        return self.__instruments
 
     def export_user_roles(self) -> List[Dict[str, Any]]:
         """Export user roles defined in the project.
 
+        The result is cached on the instance; call `invalidate_metadata`
+        to force a refetch.
+
         Returns:
             List of user role dicts specifying permissions for each role
 
         Raises:
           REDCapConnectionError if the response has an error
         """
+        if self.__user_roles is not None:
+            return self.__user_roles
+
         message = "exporting user roles"
-        data = {"content": "userRole"}
 
-        return self.__redcap_con.request_json_value(data=data, message=message)
+        self.__user_roles = self.__redcap_con.request_json_value(
+            data=_USER_ROLES_PAYLOAD, message=message
+        )
+        return self.__user_roles
+
+    @property
+    def role_label_to_name(self) -> Dict[str, str]:
+        """The map from role label to unique REDCap role name.
+
+        Computed lazily from the user roles and cached on the instance;
+        cleared by `invalidate_metadata`.
+
+        Raises:
+          REDCapConnectionError if the response has an error
+        """
+        if self.__role_names is None:
+            self.__role_names = {
+                role["role_label"]: role["unique_role_name"]
+                for role in self.export_user_roles()
+            }
+
+        return self.__role_names
 
     def export_user_role_assignments(self) -> List[Dict[str, Any]]:
         """Export user-role assignments for the project.
@@ -181,9 +287,10 @@ class REDCapProject:
           REDCapConnectionError if the response has an error
         """
         message = "exporting user-role assignments"
-        data = {"content": "userRoleMapping"}
 
-        return self.__redcap_con.request_json_value(data=data, message=message)
+        return self.__redcap_con.request_json_value(
+            data=_USER_ROLE_MAPPING_PAYLOAD, message=message
+        )
 
     def export_users(self) -> List[Dict[str, Any]]:
         """Export the list of users for the project.
@@ -203,9 +310,10 @@ class REDCapProject:
           REDCapConnectionError if the response has an error
         """
         message = "exporting users"
-        data = {"content": "user"}
 
-        return self.__redcap_con.request_json_value(data=data, message=message)
+        return self.__redcap_con.request_json_value(
+            data=_USERS_PAYLOAD, message=message
+        )
 
     def assign_user_role(self, username: str, role: str) -> int:
         """Assign given user to a user role in REDCap project.
@@ -223,11 +331,13 @@ class REDCapProject:
         data = {
             "content": "userRoleMapping",
             "action": "import",
-            "data": json.dumps([{"username": username, "unique_role_name": role}]),
+            "data": json_dumps([{"username": username, "unique_role_name": role}]),
         }
-        return self.__redcap_con.request_json_value(
+        num_assignments = self.__redcap_con.request_json_value(
             data=data, message=f"assigning user {username} to role {role}"
         )
+        self.invalidate_metadata()
+        return num_assignments
 
     def add_user(self, user_info: Dict[str, Any]) -> int:
         """Import a new user into a project and set user privileges, or update
@@ -244,13 +354,15 @@ class REDCapProject:
         """
 
         message = f"adding user {user_info['username']}"
-        info = json.dumps([user_info])
+        info = json_dumps([user_info])
         data = {
             "content": "user",
             "data": info,
         }
 
-        return self.__redcap_con.request_json_value(data=data, message=message)
+        num_users = self.__redcap_con.request_json_value(data=data, message=message)
+        self.invalidate_metadata()
+        return num_users
 
     def assign_update_user_role_by_label(self, username: str, role_label: str) -> bool:
         """Assign or update user permissions in the REDCap project.
@@ -261,13 +373,7 @@ class REDCapProject:
         """
 
         try:
-            roles = self.export_user_roles()
-            role_name = None
-            for role in roles:
-                if role["role_label"] == role_label:
-                    role_name = role["unique_role_name"]
-                    break
-
+            role_name = self.role_label_to_name.get(role_label)
             if not role_name:
                 log.error(
                     "User role %s does not exist in REDCap project %s",
@@ -308,17 +414,26 @@ class REDCapProject:
             )
             self.add_user(gearbot_user)
 
-    def import_records(self, records: str, data_format: str = "json") -> int:
+    def import_records(
+        self,
+        records: str | bytes | List[Dict[str, Any]],
+        data_format: str = "json",
+    ) -> int:
         """Import records to the REDCap project.
 
         Args:
-            records: List of records to be imported as a csv/json string
+            records: Records to be imported as a csv/json string, JSON
+                bytes, or a list of record objects serialized here
             data_format (optional): Import format, defaults to 'json'.
 
         Raises:
           REDCapConnectionError if the response has an error.
         """
 
+        # serialize record objects once, directly to bytes
+        if isinstance(records, list):
+            records = json_dumps_bytes(records)
+
         message = "importing records"
         data = {
             "content": "record",
@@ -337,7 +452,7 @@ class REDCapProject:
             )
 
         try:
-            num_records = json.loads(response.text)["count"]
+            num_records = json_loads(response.content)["count"]
         except (JSONDecodeError, ValueError) as error:
             raise REDCapConnectionError(message=message) from error
 
@@ -381,6 +496,228 @@ class REDCapProject:
           REDCapConnectionError if the response has an error.
         """
 
+        # Large ID lists are split so each request body stays bounded and
+        # successive requests reuse the kept-alive connection. Only JSON
+        # and CSV results can be merged; other formats (xml, odm) are
+        # documents and go out as a single request.
+        if (
+            record_ids
+            and len(record_ids) > _RECORD_ID_CHUNK_SIZE
+            and exp_format.lower() in ("json", "csv")
+        ):
+            return self.__export_record_id_chunks(
+                exp_format=exp_format,
+                record_ids=record_ids,
+                fields=fields,
+                forms=forms,
+                events=events,
+                filters=filters,
+                date_range_begin=date_range_begin,
+                date_range_end=date_range_end,
+            )
+
+        data = self.__build_record_export_data(
+            record_ids=record_ids,
+            fields=fields,
+            forms=forms,
+            events=events,
+            filters=filters,
+            date_range_begin=date_range_begin,
+            date_range_end=date_range_end,
+        )
+
+        message = "failed to export records"
+        if exp_format.lower() == "json":
+            return self.__redcap_con.request_json_value(data=data, message=message)
+
+        return self.__redcap_con.request_text_value(
+            data=data, result_format=exp_format, message=message
+        )
+
+    def __export_record_id_chunks(
+        self, *, exp_format: str, record_ids: list[str], **kwargs
+    ) -> List[Dict[str, str]] | str:
+        """Exports records for a large ID list in fixed-size chunks.
+
+        Issues one export per chunk of IDs and merges the results; for
+        CSV the repeated header line is dropped from all but the first
+        chunk. Only JSON and CSV results are mergeable.
+
+        Returns:
+            The merged list of records or text string
+
+        Raises:
+          REDCapConnectionError if a response has an error.
+        """
+
+        if exp_format.lower() == "json":
+            records: List[Dict[str, str]] = []
+            for chunk in _chunked(record_ids, _RECORD_ID_CHUNK_SIZE):
+                chunk_records = self.export_records(
+                    exp_format=exp_format, record_ids=chunk, **kwargs
+                )
+                assert isinstance(chunk_records, list)
+                records.extend(chunk_records)
+            return records
+
+        parts: List[str] = []
+        for chunk in _chunked(record_ids, _RECORD_ID_CHUNK_SIZE):
+            text = self.export_records(
+                exp_format=exp_format, record_ids=chunk, **kwargs
+            )
+            assert isinstance(text, str)
+            if parts:
+                # drop the repeated header line
+                text = text.split("\n", 1)[-1]
+            # join on a line boundary so chunks without a trailing
+            # newline do not fuse their last row with the next chunk
+            text = text.rstrip("\n")
+            if text:
+                parts.append(text)
+
+        return "\n".join(parts)
+
+    def export_records_iter(
+        self,
+        *,
+        record_ids: Optional[list[str]] = None,
+        fields: Optional[list[str]] = None,
+        forms: Optional[list[str]] = None,
+        events: Optional[list[str]] = None,
+        filters: Optional[str] = None,
+        date_range_begin: Optional[str] = None,
+        date_range_end: Optional[str] = None,
+    ) -> Iterator[Dict[str, str]]:
+        """Export records from the REDCap project, one record at a time.
+
+        Streams the response body and parses records incrementally with
+        ijson when available, bounding resident memory to roughly one
+        record regardless of export size. Bulk decoding is faster for
+        small exports, so prefer `export_records` unless the export is
+        large enough (tens of MB) for memory to matter. Falls back to a
+        bulk export when ijson is not installed.
+
+        Args:
+            record_ids (Optional): List of record IDs to be exported
+            fields (Optional): List of fields to be included
+            forms (Optional): List of forms to be included
+            events (Optional): List of events to be included
+            filters (Optional) : Filter logic as a string (e.g. [age]>30)
+            date_range_begin (Optional): Return only records created or
+                modified after this date/time
+            date_range_end (Optional): Return only records created or
+                modified before this date/time
+
+        Yields:
+            The records (JSON objects) one at a time
+
+        Raises:
+          REDCapConnectionError if the response has an error.
+        """
+
+        data = self.__build_record_export_data(
+            record_ids=record_ids,
+            fields=fields,
+            forms=forms,
+            events=events,
+            filters=filters,
+            date_range_begin=date_range_begin,
+            date_range_end=date_range_end,
+        )
+
+        message = "failed to export records"
+        if ijson is None:
+            yield from self.__redcap_con.request_json_value(data=data, message=message)
+            return
+
+        response = self.__redcap_con.post_request(
+            data=data, result_format="json", stream=True
+        )
+        try:
+            if not response.ok:
+                raise REDCapConnectionError(
+                    message=error_message(message=message, response=response)
+                )
+
+            # urllib3 leaves streamed bodies compressed; have the raw
+            # stream gunzip as it is read so ijson sees JSON bytes
+            response.raw.decode_content = True
+            try:
+                yield from ijson.items(response.raw, "item")
+            except ijson.JSONError as error:
+                raise REDCapConnectionError(message=message) from error
+        finally:
+            response.close()
+
+    def export_records_df(
+        self,
+        *,
+        record_ids: Optional[list[str]] = None,
+        fields: Optional[list[str]] = None,
+        forms: Optional[list[str]] = None,
+        events: Optional[list[str]] = None,
+        filters: Optional[str] = None,
+        date_range_begin: Optional[str] = None,
+        date_range_end: Optional[str] = None,
+    ) -> Any:
+        """Export records from the REDCap project as a pandas DataFrame.
+
+        Exports in CSV format, which is far more compact on the wire
+        than JSON (no repeated keys per record), and parses with
+        pandas' C-accelerated CSV reader instead of building a dict per
+        record. Intended for bulk analytical consumers; requires pandas
+        to be installed.
+
+        Args:
+            record_ids (Optional): List of record IDs to be exported
+            fields (Optional): List of fields to be included
+            forms (Optional): List of forms to be included
+            events (Optional): List of events to be included
+            filters (Optional) : Filter logic as a string (e.g. [age]>30)
+            date_range_begin (Optional): Return only records created or
+                modified after this date/time
+            date_range_end (Optional): Return only records created or
+                modified before this date/time
+
+        Returns:
+            DataFrame of records with all columns read as strings
+
+        Raises:
+          REDCapConnectionError if the response has an error.
+        """
+        import pandas  # type: ignore  # imported lazily, optional dependency
+
+        text = self.export_records(
+            exp_format="csv",
+            record_ids=record_ids,
+            fields=fields,
+            forms=forms,
+            events=events,
+            filters=filters,
+            date_range_begin=date_range_begin,
+            date_range_end=date_range_end,
+        )
+        assert isinstance(text, str)
+
+        return pandas.read_csv(StringIO(text), dtype=str)
+
+    def __build_record_export_data(
+        self,
+        *,
+        record_ids: Optional[list[str]] = None,
+        fields: Optional[list[str]] = None,
+        forms: Optional[list[str]] = None,
+        events: Optional[list[str]] = None,
+        filters: Optional[str] = None,
+        date_range_begin: Optional[str] = None,
+        date_range_end: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Builds the request data object for a record export.
+
+        Returns:
+            The request data with the specified export filters set
+        """
+
         data = {"content": "record", "action": "export", "returnFormat": "json"}
 
         # If set of record ids specified, export only those records.
@@ -411,14 +748,60 @@ class REDCapProject:
         if date_range_end:
             data["dateRangeEnd"] = date_range_end
 
-        message = "failed to export records"
-        if exp_format.lower() == "json":
-            return self.__redcap_con.request_json_value(data=data, message=message)
+        return data
 
-        return self.__redcap_con.request_text_value(
-            data=data, result_format=exp_format, message=message
+    def export_records_batched(
+        self, *, batch_size: int = 500, max_workers: int = 4
+    ) -> Iterator[List[Dict[str, str]]]:
+        """Export records from the REDCap project in batches of record IDs.
+
+        Fetches the record IDs first, then exports the records for each
+        batch of IDs on a thread pool so the network round-trips overlap.
+        At most max_workers batches are in flight at a time, so consuming
+        the generator bounds peak memory to roughly one batch per worker
+        instead of the full dataset.
+
+        Args:
+            batch_size: Number of record IDs per batch, defaults to 500
+            max_workers: Number of concurrent export requests, defaults to 4
+
+        Yields:
+            The list of records (JSON objects) for each batch
+
+        Raises:
+          REDCapConnectionError if a response has an error.
+        """
+
+        id_records = self.export_records(fields=[self.__pk_field])
+        assert isinstance(id_records, list)
+        # dedupe IDs preserving order; longitudinal projects repeat them
+        record_ids = list(
+            dict.fromkeys(record[self.__pk_field] for record in id_records)
         )
 
+        batches = iter(
+            record_ids[index : index + batch_size]
+            for index in range(0, len(record_ids), batch_size)
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # keep at most max_workers batches in flight; submitting
+            # everything up front would let completed results pile up
+            # faster than the consumer drains them
+            pending = deque(
+                executor.submit(self.export_records, record_ids=batch)
+                for batch in itertools.islice(batches, max_workers)
+            )
+            while pending:
+                result = pending.popleft().result()
+                batch = next(batches, None)
+                if batch is not None:
+                    pending.append(
+                        executor.submit(self.export_records, record_ids=batch)
+                    )
+                assert isinstance(result, list)
+                yield result
+
     def export_report(
         self, report_id: str, exp_format: str = "json"
     ) -> List[Dict[str, str]] | str:
@@ -451,34 +834,47 @@ class REDCapProject:
     def export_events(self) -> List[Dict[str, Any]]:
         """Exports the events defined in the project.
 
+        The result is cached on the instance; call `invalidate_metadata`
+        to force a refetch.
+
         Returns:
             List[Dict[str, str]]: List of event info Dicts
 
         Raises:
           REDCapConnectionError if the response has an error.
         """
+        if self.__events is not None:
+            return self.__events
+
         message = "exporting events"
-        data = {"content": "event"}
 
-        return self.__redcap_con.request_json_value(data=data, message=message)
+        self.__events = self.__redcap_con.request_json_value(
+            data=_EVENTS_PAYLOAD, message=message
+        )
+        return self.__events
 
     def get_event_name_for_label(self, label: str) -> Optional[str]:
         """Returns the unique REDCap event name for given label.
 
+        Builds a label to event name map on first call so repeated
+        lookups avoid scanning the event list.
+
         Returns:
             Optional[str]: REDCap event name if found, else None
         """
 
-        try:
-            events = self.export_events()
-        except REDCapConnectionError as error:
-            log.error(
-                "Failed to retrieve events for project %s - %s", self.title, error
-            )
-            return None
+        if self.__event_names is None:
+            try:
+                events = self.export_events()
+            except REDCapConnectionError as error:
+                log.error(
+                    "Failed to retrieve events for project %s - %s", self.title, error
+                )
+                return None
 
-        for event in events:
-            if label == event["event_name"].lower():
-                return event["unique_event_name"]
+            self.__event_names = {
+                event["event_name"].lower(): event["unique_event_name"]
+                for event in events
+            }
 
-        return None
+        return self.__event_names.get(label)
@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
 
 from redcap_api.redcap_connection import (
     REDCapConnection,
@@ -16,6 +17,7 @@ class REDCapParametersRepository:
 
     def __init__(self, redcap_params: Optional[Dict[str, REDCapParameters]] = None):
         self.__redcap_params = redcap_params if redcap_params else {}
+        self.__project_cache: Dict[int, REDCapProject] = {}
 
     @property
     def redcap_params(self) -> Dict[str, REDCapParameters]:
@@ -69,6 +71,9 @@ class REDCapParametersRepository:
         """Get an API connection to the REDCap project identified by the PID
         using parameters stored in the repo.
 
+        Projects are cached by PID, so repeated retrievals reuse the
+        connection and its metadata instead of re-fetching from REDCap.
+
         Args:
             pid: REDCap PID
 
@@ -76,6 +81,10 @@ class REDCapParametersRepository:
             REDCapProject(optional): REDCap project if connection is successful
         """
 
+        cached_project = self.__project_cache.get(pid)
+        if cached_project:
+            return cached_project
+
         redcap_params = self.get_project_parameters(pid)
         if not redcap_params:
             log.error(
@@ -85,7 +94,33 @@ class REDCapParametersRepository:
 
         redcap_con = REDCapConnection.create_from(redcap_params)
         try:
-            return REDCapProject.create(redcap_con)
+            project = REDCapProject.create(redcap_con)
         except REDCapConnectionError as error:
             log.error(error)
             return None
+
+        self.__project_cache[pid] = project
+        return project
+
+    def get_redcap_projects(
+        self, pids: Iterable[int], max_workers: int = 16
+    ) -> Dict[int, Optional[REDCapProject]]:
+        """Get API connections to the REDCap projects identified by the PIDs.
+
+        Fans the per-project metadata round-trips out over a thread pool
+        since each lookup is I/O bound.
+
+        Args:
+            pids: REDCap PIDs
+            max_workers: Number of concurrent lookups, defaults to 16
+
+        Returns:
+            Map from PID to the REDCap project, None where the
+            connection failed
+        """
+
+        pid_list = list(pids)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            projects = executor.map(self.get_redcap_project, pid_list)
+
+        return dict(zip(pid_list, projects, strict=True))
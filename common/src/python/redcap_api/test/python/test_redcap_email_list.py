@@ -0,0 +1,71 @@
+"""Tests for REDCapEmailList."""
+
+from unittest.mock import create_autospec
+
+import pytest
+from redcap_api.redcap_connection import REDCapReportConnection
+from redcap_api.redcap_email_list import REDCapEmailList, REDCapEmailListError
+
+
+@pytest.fixture()
+def mock_connection():
+    """Create a mock REDCapReportConnection."""
+    return create_autospec(REDCapReportConnection, instance=True)
+
+
+class TestREDCapEmailList:
+    """Tests for the REDCapEmailList class."""
+
+    def test_maps_email_to_record(self, mock_connection):
+        """Test that each email maps to its full report record."""
+        records = [
+            {"email": "jsmith@example.com", "username": "jsmith"},
+            {"email": "mjones@example.com", "username": "mjones"},
+        ]
+        mock_connection.report_records = records
+
+        email_list = REDCapEmailList(redcap_con=mock_connection)
+
+        assert dict(email_list.email_list) == {
+            "jsmith@example.com": records[0],
+            "mjones@example.com": records[1],
+        }
+
+    def test_empty_report(self, mock_connection):
+        """Test that an empty report gives an empty email list."""
+        mock_connection.report_records = []
+
+        email_list = REDCapEmailList(redcap_con=mock_connection)
+
+        assert dict(email_list.email_list) == {}
+
+    def test_custom_email_key(self, mock_connection):
+        """Test that the report field holding the email can be set."""
+        records = [{"contact": "jsmith@example.com", "username": "jsmith"}]
+        mock_connection.report_records = records
+
+        email_list = REDCapEmailList(redcap_con=mock_connection, email_key="contact")
+
+        assert dict(email_list.email_list) == {"jsmith@example.com": records[0]}
+
+    def test_duplicate_email_raises(self, mock_connection):
+        """Test that distinct records sharing an email raise an error."""
+        mock_connection.report_records = [
+            {"email": "jsmith@example.com", "username": "jsmith"},
+            {"email": "jsmith@example.com", "username": "jsmith2"},
+        ]
+
+        with pytest.raises(REDCapEmailListError) as e:
+            REDCapEmailList(redcap_con=mock_connection)
+
+        assert str(e.value) == "Duplicate email: jsmith@example.com"
+
+    def test_email_list_read_only(self, mock_connection):
+        """Test that the email list view cannot be mutated."""
+        record = {"email": "jsmith@example.com", "username": "jsmith"}
+        mock_connection.report_records = [record]
+
+        email_list = REDCapEmailList(redcap_con=mock_connection)
+
+        with pytest.raises(TypeError):
+            email_list.email_list["other@example.com"] = record  # type: ignore[index]
@@ -155,6 +155,107 @@ class TestExportUsers:
             project.export_users()
 
 
+class TestExportRecordsChunked:
+    """Tests for export_records chunking of large record ID lists."""
+
+    def test_small_id_list_passthrough(self, project, mock_connection):
+        """Test that up to 500 IDs are exported in a single request."""
+        record_ids = [str(i) for i in range(500)]
+        mock_connection.request_json_value.return_value = []
+
+        project.export_records(record_ids=record_ids)
+
+        mock_connection.request_json_value.assert_called_once()
+        data = mock_connection.request_json_value.call_args.kwargs["data"]
+        assert data["records"] == ",".join(record_ids)
+
+    def test_json_chunks_merged(self, project, mock_connection):
+        """Test that a large ID list is split and the records merged."""
+        record_ids = [str(i) for i in range(600)]
+        mock_connection.request_json_value.side_effect = [
+            [{"record_id": "1"}],
+            [{"record_id": "2"}],
+        ]
+
+        result = project.export_records(record_ids=record_ids)
+
+        assert result == [{"record_id": "1"}, {"record_id": "2"}]
+        assert mock_connection.request_json_value.call_count == 2
+        requested = [
+            call.kwargs["data"]["records"]
+            for call in mock_connection.request_json_value.call_args_list
+        ]
+        assert requested == [
+            ",".join(record_ids[:500]),
+            ",".join(record_ids[500:]),
+        ]
+
+    def test_csv_chunks_drop_repeated_header(self, project, mock_connection):
+        """Test that CSV chunks merge on line boundaries with one header."""
+        record_ids = [str(i) for i in range(1200)]
+        # chunk bodies without trailing newlines must not fuse rows
+        mock_connection.request_text_value.side_effect = [
+            "h1,h2\nr,1",
+            "h1,h2\nr,2\n",
+            "h1,h2\nr,3",
+        ]
+
+        result = project.export_records(exp_format="csv", record_ids=record_ids)
+
+        assert result == "h1,h2\nr,1\nr,2\nr,3"
+        assert mock_connection.request_text_value.call_count == 3
+
+    def test_unmergeable_format_single_request(self, project, mock_connection):
+        """Test that xml exports are not chunked; documents cannot be merged."""
+        record_ids = [str(i) for i in range(600)]
+        mock_connection.request_text_value.return_value = "<records/>"
+
+        result = project.export_records(exp_format="xml", record_ids=record_ids)
+
+        assert result == "<records/>"
+        mock_connection.request_text_value.assert_called_once()
+        data = mock_connection.request_text_value.call_args.kwargs["data"]
+        assert data["records"] == ",".join(record_ids)
+
+
+class TestExportRecordsBatched:
+    """Tests for the export_records_batched method."""
+
+    def test_batches_deduplicated_ids(self, project, mock_connection):
+        """Test that IDs are prefetched, deduplicated, and batched."""
+        id_records = [
+            {"record_id": "1"},
+            {"record_id": "2"},
+            # longitudinal projects repeat IDs across events
+            {"record_id": "1"},
+            {"record_id": "3"},
+        ]
+        batch_one = [{"record_id": "1"}, {"record_id": "2"}]
+        batch_two = [{"record_id": "3"}]
+        mock_connection.request_json_value.side_effect = [
+            id_records,
+            batch_one,
+            batch_two,
+        ]
+
+        result = list(project.export_records_batched(batch_size=2, max_workers=1))
+
+        assert result == [batch_one, batch_two]
+        payloads = [
+            call.kwargs["data"]
+            for call in mock_connection.request_json_value.call_args_list
+        ]
+        assert payloads[0]["fields"] == "record_id"
+        assert payloads[1]["records"] == "1,2"
+        assert payloads[2]["records"] == "3"
+
+    def test_no_records(self, project, mock_connection):
+        """Test that an empty project yields no batches."""
+        mock_connection.request_json_value.return_value = []
+
+        assert list(project.export_records_batched()) == []
+
+
 class TestExportUsersProperties:
     """Property-based tests for the export_users method.
 
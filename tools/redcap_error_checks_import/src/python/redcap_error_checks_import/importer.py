@@ -1,11 +1,12 @@
 """Defines REDCap Import Error Checks."""
 
-import json
 import logging
-from io import StringIO
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BufferedReader, TextIOWrapper
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 from pydantic import TypeAdapter
 from redcap_api.redcap_connection import (
     REDCapConnection,
@@ -23,6 +24,12 @@ from .utils.visitor import ErrorCheckCSVVisitor, read_csv
 
 log = logging.getLogger(__name__)
 
+# built once at import; TypeAdapter construction compiles a validator
+_REDCAP_PARAMS_ADAPTER = TypeAdapter(REDCapParameters)
+
+# number of records sent to REDCap per import request
+_IMPORT_BATCH_SIZE = 500
+
 
 class REDCapErrorChecksImporter:
     """Class to define REDCap error checks importer."""
@@ -55,9 +62,13 @@ class REDCapErrorChecksImporter:
         else:
             session = boto3.Session()
 
-        # get S3 bucket
+        # get S3 bucket; widen the connection pool so concurrent
+        # downloads are not serialized on the default 10 connections,
+        # and keep the TCP connections alive between requests
         self.__bucket = s3_bucket
-        self.__s3 = session.client("s3")
+        self.__s3 = session.client(
+            "s3", config=Config(max_pool_connections=32, tcp_keepalive=True)
+        )
 
         # build redcap project from parameter store
         raw_parameters = session.client("ssm").get_parameters_by_path(
@@ -67,9 +78,7 @@ class REDCapErrorChecksImporter:
         parameters = {
             x["Name"].split("/")[-1]: x["Value"] for x in raw_parameters["Parameters"]
         }
-        type_adapter = TypeAdapter(REDCapParameters)
-
-        redcap_params = type_adapter.validate_python(parameters)
+        redcap_params = _REDCAP_PARAMS_ADAPTER.validate_python(parameters)
         redcap_connection = REDCapConnection.create_from(redcap_params)
         self.__redcap_project = REDCapProject.create(redcap_connection)
 
@@ -89,34 +98,62 @@ class REDCapErrorChecksImporter:
         return f"s3://{self.__bucket}/{key.full_path}"
 
     @classmethod
-    def load_error_check_csv(
-        cls, key: ErrorCheckKey, file: Dict[Any, Any], stats: ErrorCheckImportStats
+    def read_error_checks(
+        cls, key: ErrorCheckKey, file: Dict[Any, Any], fail_fast: bool = False
     ) -> Optional[List[Dict[str, Any]]]:
-        """Load the error check CSV.
+        """Read and validate the error checks from the CSV.
+
+        Does not touch shared state, so it is safe to call from worker
+        threads; the duplicate check against the running stats happens
+        on the main thread.
 
         Args:
             key: ErrorCheckKey containing details about the S3 key
             file: The S3 file object
+            fail_fast: Whether to stop at the first validation error
+                instead of reporting every problem in the file
         Returns:
             List of the validated and read in error checks.
         """
-        visitor = ErrorCheckCSVVisitor(key=key)
-        data = StringIO(file["Body"].read().decode("utf-8-sig"))
+        visitor = ErrorCheckCSVVisitor(key=key, fail_fast=fail_fast)
+        # stream the body straight into the CSV parser through a 1 MiB
+        # buffer instead of materializing the whole file first
+        raw = BufferedReader(file["Body"], buffer_size=1 << 20)
+        data = TextIOWrapper(raw, encoding="utf-8-sig", newline="")
         success = read_csv(input_file=data, visitor=visitor)
 
         if not success:
-            log.error(f"Errors encountered while reading from {key.full_path}:")
+            log.error("Errors encountered while reading from %s:", key.full_path)
             return None
 
         error_checks = visitor.validated_error_checks
         if not error_checks:
-            log.error(f"No error checks found in {key.full_path}; invalid file?")
+            log.error("No error checks found in %s; invalid file?", key.full_path)
+            return None
+
+        return error_checks
+
+    @classmethod
+    def load_error_check_csv(
+        cls, key: ErrorCheckKey, file: Dict[Any, Any], stats: ErrorCheckImportStats
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Load the error check CSV and check for duplicate error codes.
+
+        Args:
+            key: ErrorCheckKey containing details about the S3 key
+            file: The S3 file object
+            stats: The running import stats for the duplicate check
+        Returns:
+            List of the validated and read in error checks.
+        """
+        error_checks = cls.read_error_checks(key, file)
+        if not error_checks:
             return None
 
         # check for duplicates
         duplicates = stats.add_error_codes([x["error_code"] for x in error_checks])
         if duplicates:
-            log.error(f"Found duplicated errors, will not import file: {duplicates}")
+            log.error("Found duplicated errors, will not import file: %s", duplicates)
             return None
 
         return error_checks
@@ -131,48 +168,110 @@ class REDCapErrorChecksImporter:
             log.info("DRY RUN: Skipping import.")
             return
 
-        # Upload to REDCap; import each record in JSON format
+        # Upload to REDCap; import each record in JSON format. Passing
+        # the records through lets import_records serialize them with
+        # orjson when available
         try:
             num_records = self.__redcap_project.import_records(
-                json.dumps(error_checks), data_format="json"
+                error_checks, data_format="json"
             )
-            log.info(f"Imported {num_records} records")
+            log.info("Imported %s records", num_records)
             self.__stats.add_to_total_records(num_records)
         except REDCapConnectionError as error:
             raise RuntimeException(error.message) from error
 
+    def __collect_error_check_keys(self) -> List[ErrorCheckKey]:
+        """Collect the S3 keys of the error check CSVs to import.
+
+        Narrows the listing to per-module prefixes when specific modules
+        were requested so the filtering happens server-side, and
+        paginates so listings past 1000 keys are not silently dropped.
+
+        Returns:
+            List of ErrorCheckKeys for the CSVs matching the modules
+        """
+        if self.__modules != ["all"]:
+            prefixes = [f"CSV/{module}/" for module in self.__modules]
+        else:
+            prefixes = ["CSV/"]
+
+        paginator = self.__s3.get_paginator("list_objects_v2")
+        error_keys = []
+        for prefix in prefixes:
+            for page in paginator.paginate(Bucket=self.__bucket, Prefix=prefix):
+                for file_metadata in page.get("Contents", []):
+                    key = file_metadata.get("Key")
+                    if not key or not key.endswith(".csv"):
+                        continue
+
+                    error_keys.append(ErrorCheckKey.create_from_key(key))
+
+        return error_keys
+
+    def __fetch_and_parse(
+        self, error_key: ErrorCheckKey
+    ) -> Tuple[ErrorCheckKey, Optional[List[Dict[str, Any]]]]:
+        """Download and parse the error check CSV for the key.
+
+        Runs on a worker thread; only touches the S3 client, which is
+        thread-safe.
+
+        Args:
+            error_key: ErrorCheckKey for the CSV to load
+        Returns:
+            Tuple of the key and the validated error checks, if any
+        """
+        file = self.__s3.get_object(Bucket=self.__bucket, Key=error_key.full_path)
+        full_path = self.build_full_path(error_key)
+        log.info("Loading error checks from %s", full_path)
+        return error_key, self.read_error_checks(
+            error_key, file, fail_fast=self.__fail_fast
+        )
+
     def run(self) -> None:
         """Runs the REDCAP Error Checks import process."""
         log.info("Running REDCAP error check import")
 
-        # we shouldn't ever have > 1000 error CSVs so don't need
-        # to worry about pagination here
-        s3_params = {"Bucket": self.__bucket, "Prefix": "CSV"}
-        for file_metadata in self.__s3.list_objects_v2(**s3_params).get("Contents", []):
-            key = file_metadata.get("Key")
-            if not key or not key.endswith(".csv"):
-                continue
-
-            error_key = ErrorCheckKey.create_from_key(key)
-            if self.__modules != ["all"] and error_key.module not in self.__modules:
-                continue
-
-            # Load from files from S3
-            file = self.__s3.get_object(Bucket=self.__bucket, Key=key)
-            full_path = self.build_full_path(error_key)
-            log.info(f"Loading error checks from {full_path}")
-            error_checks = self.load_error_check_csv(error_key, file, self.__stats)
-
-            if not error_checks:
-                if self.__fail_fast:
-                    log.error("fail_fast set to True, halting execution")
-                    return
-                else:
-                    log.info("Errors encountered, continuing to next file")
-                    self.__stats.add_failed_file(key)
-                    continue
-
-            self.import_to_redcap(error_checks)
+        error_keys = self.__collect_error_check_keys()
+
+        # Fetch and parse the independent files concurrently so the S3
+        # round-trips overlap; the duplicate check against the shared
+        # stats stays on the main thread.
+        all_checks: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [
+                executor.submit(self.__fetch_and_parse, error_key)
+                for error_key in error_keys
+            ]
+            for future in as_completed(futures):
+                error_key, error_checks = future.result()
+
+                if error_checks:
+                    duplicates = self.__stats.add_error_codes(
+                        [x["error_code"] for x in error_checks]
+                    )
+                    if duplicates:
+                        log.error(
+                            "Found duplicated errors, will not import file: %s",
+                            duplicates,
+                        )
+                        error_checks = None
+
+                if not error_checks:
+                    if self.__fail_fast:
+                        log.error("fail_fast set to True, halting execution")
+                        executor.shutdown(cancel_futures=True)
+                        return
+                    else:
+                        log.info("Errors encountered, continuing to next file")
+                        self.__stats.add_failed_file(error_key.full_path)
+                        continue
+
+                all_checks.extend(error_checks)
+
+        # import once in batches rather than a REDCap round-trip per file
+        for start in range(0, len(all_checks), _IMPORT_BATCH_SIZE):
+            self.import_to_redcap(all_checks[start : start + _IMPORT_BATCH_SIZE])
 
         # if we did not fail fast before, fail now
         if self.__stats.failed_files:
@@ -185,6 +284,6 @@ class REDCapErrorChecksImporter:
             log.warning("No error codes read")
         else:
             log.info(
-                f"Import complete! Imported {self.__stats.total_records} "
-                + "total records"
+                "Import complete! Imported %s total records",
+                self.__stats.total_records,
             )
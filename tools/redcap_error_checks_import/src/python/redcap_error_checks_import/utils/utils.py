@@ -1,17 +1,24 @@
 """Defines model/util classes specifically used for importing error checks into
 REDCap."""
 
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 
-from pydantic import BaseModel
+# matches CSV / MODULE / FORM_VER / PACKET / filename, with the packet
+# component optional for modules such as ENROLL
+_KEY_PATTERN = re.compile(r"CSV/([^/]+)/([^/]+)(?:/([^/]+))?/([^/]+)\Z")
 
 
 class RuntimeException(Exception):
     pass
 
 
-class ErrorCheckKey(BaseModel):
-    """Pydantic model for the error check key.
+@dataclass(frozen=True, slots=True)
+class ErrorCheckKey:
+    """Dataclass for the error check key.
 
     Expects to be of the form:
         CSV / MODULE / FORM_VER / PACKET /
@@ -31,62 +38,19 @@ class ErrorCheckKey(BaseModel):
     packet: Optional[str] = None
     ignore_headers: bool = False
 
-    @staticmethod
-    def create_from_key(key: str):
+    @classmethod
+    def create_from_key(cls, key: str) -> "ErrorCheckKey":
         """Create ErrorCheckKey from key.
 
+        Parsed keys are cached, so repeated calls with the same S3 key
+        share one frozen instance instead of re-parsing.
+
         Args:
             key: The S3 key
         Returns:
             instantiated ErrorCheckKey
         """
-        key_parts = key.split("/")
-
-        if key_parts[0] != "CSV":
-            raise ValueError("Expected CSV at top level of S3 key")
-
-        if len(key_parts) == 5:
-            module = key_parts[1]
-            filename = key_parts[4]
-            form_name = filename.split("_")[1]
-            if form_name == "header":
-                form_name = f"{module.lower()}_header"
-
-            return ErrorCheckKey(
-                full_path=key,
-                csv=key_parts[0],
-                module=module,
-                form_ver=key_parts[2],
-                packet=key_parts[3],
-                filename=filename,
-                form_name=form_name,
-            )
-        elif len(key_parts) == 4:
-            module = key_parts[1]
-            assert module not in ["UDS", "FTLD", "LBD", "DS"]
-            filename = key_parts[3]
-
-            form_name = filename.split("_")[1]
-            if module == "ENROLL":
-                form_name = "enrl"
-            elif module == "MLST":
-                form_name = "milestones"
-
-            return ErrorCheckKey(
-                full_path=key,
-                csv=key_parts[0],
-                module=module,
-                form_ver=key_parts[2],
-                filename=filename,
-                form_name=form_name,
-                ignore_headers=module == "PREPROCESS",
-            )
-
-        raise ValueError(
-            f"Cannot parse ErrorCheckKey components from {key}; "
-            + "Expected to be of the form "
-            + "CSV / MODULE / FORM_VER / PACKET / filename"
-        )
+        return _parse_error_check_key(key)
 
     def get_visit_type(self) -> Optional[str]:
         """Determine visit type from packet.
@@ -103,13 +67,78 @@ class ErrorCheckKey(BaseModel):
         return "fvp" if self.packet.startswith("F") else "ivp"
 
 
+@lru_cache(maxsize=1024)
+def _parse_error_check_key(key: str) -> ErrorCheckKey:
+    """Parses the S3 key into an ErrorCheckKey.
+
+    Args:
+        key: The S3 key
+    Returns:
+        instantiated ErrorCheckKey
+    """
+    if key.split("/", 1)[0] != "CSV":
+        raise ValueError("Expected CSV at top level of S3 key")
+
+    match = _KEY_PATTERN.match(key)
+    if not match:
+        raise ValueError(
+            f"Cannot parse ErrorCheckKey components from {key}; "
+            + "Expected to be of the form "
+            + "CSV / MODULE / FORM_VER / PACKET / filename"
+        )
+
+    module, form_ver, packet, filename = match.groups()
+
+    if packet is not None:
+        form_name = filename.split("_")[1]
+        if form_name == "header":
+            form_name = f"{module.lower()}_header"
+
+        return ErrorCheckKey(
+            full_path=key,
+            csv="CSV",
+            module=module,
+            form_ver=form_ver,
+            packet=packet,
+            filename=filename,
+            form_name=form_name,
+        )
+
+    assert module not in ["UDS", "FTLD", "LBD", "DS"]
+
+    form_name = filename.split("_")[1]
+    if module == "ENROLL":
+        form_name = "enrl"
+    elif module == "MLST":
+        form_name = "milestones"
+
+    return ErrorCheckKey(
+        full_path=key,
+        csv="CSV",
+        module=module,
+        form_ver=form_ver,
+        filename=filename,
+        form_name=form_name,
+        ignore_headers=module == "PREPROCESS",
+    )
+
+
 class ErrorCheckImportStats:
     """Class for keeping track of import stats."""
 
+    __slots__ = (
+        "__all_error_codes",
+        "__failed_files",
+        "__seen_error_codes",
+        "__total_records",
+    )
+
     def __init__(self):
         """Initializer."""
         self.__total_records = 0
         self.__all_error_codes = []
+        # set mirror of all_error_codes for O(1) duplicate checks
+        self.__seen_error_codes = set()
         self.__failed_files = []
 
     @property
@@ -148,15 +177,22 @@ class ErrorCheckImportStats:
         adds the duplicates regardless, that way we don't drop unrelated error
         codes. It is up to the caller to decide what to do about it.
 
+        Counts the batch in one hash pass, so codes repeated within the
+        batch are reported as duplicates along with codes seen in
+        earlier batches.
+
         Args:
             error_codes: The error codes to add
         Returns:
             The list of duplicates, if any are found
         """
-        duplicates = []
-        for code in error_codes:
-            if code in self.__all_error_codes:
-                duplicates.append(code)
-
+        counts = Counter(error_codes)
+        duplicates = [
+            code
+            for code, count in counts.items()
+            if count > 1 or code in self.__seen_error_codes
+        ]
+
+        self.__seen_error_codes.update(counts)
         self.__all_error_codes.extend(error_codes)
         return duplicates
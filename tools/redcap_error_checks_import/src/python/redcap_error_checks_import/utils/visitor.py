@@ -1,13 +1,31 @@
 """Module to handle downloading error check CSVs from S3."""
 
 import logging
-from csv import DictReader, Error
-from typing import Any, Dict, List, TextIO
+from csv import Error, reader
+from typing import Any, Dict, List, TextIO, Tuple
 
 from .utils import ErrorCheckKey
 
 log = logging.getLogger(__name__)
 
+# identity map of short values repeated across most rows; routing the
+# upload values through it lets equal strings share one instance
+# instead of each row holding its own copy
+_COMMON_VALUES = {
+    value: value
+    for value in (
+        "",
+        "Error",
+        "Warning",
+        "Missingness",
+        "Range",
+        "Compatibility",
+        "I",
+        "I4",
+        "F",
+    )
+}
+
 
 class ErrorCheckCSVVisitor:
     """Visitor for an Error Check CSV file."""
@@ -31,11 +49,46 @@ class ErrorCheckCSVVisitor:
 
     ALLOWED_EMPTY_FIELDS = ("comp_forms", "comp_vars")
 
-    def __init__(self, key: ErrorCheckKey) -> None:
-        """Initializer."""
+    # frozenset mirror for O(1) membership checks; the tuple keeps the
+    # field-ordering contract
+    ALLOWED_EMPTY_FIELDS_SET = frozenset(ALLOWED_EMPTY_FIELDS)
+
+    __slots__ = (
+        "__fail_fast",
+        "__form_name",
+        "__form_name_len",
+        "__key",
+        "__packet",
+        "__upload_fields",
+        "__validated_error_checks",
+        "__visit_type",
+    )
+
+    def __init__(self, key: ErrorCheckKey, fail_fast: bool = False) -> None:
+        """Initializer.
+
+        Args:
+            key: ErrorCheckKey for the file being visited
+            fail_fast: Whether to stop validating a row at its first
+                error instead of reporting every problem
+        """
         self.__key = key
+        self.__fail_fast = fail_fast
+        # cache the key fields consulted on every row
+        self.__form_name = key.form_name
+        self.__form_name_len = len(key.form_name)
+        self.__packet = key.packet
+        self.__visit_type = key.get_visit_type()
+        # narrowed to the required fields present in the file once the
+        # header is visited
+        self.__upload_fields: Tuple[str, ...] = self.REQUIRED_HEADERS
         self.__validated_error_checks: List[Dict[str, Any]] = []
 
+    @property
+    def fail_fast(self) -> bool:
+        """Whether the visitor stops at the first row error."""
+        return self.__fail_fast
+
     @property
     def validated_error_checks(self) -> List[Dict[str, Any]]:
         """Get the validated error checks.
@@ -53,23 +106,33 @@ class ErrorCheckCSVVisitor:
         Returns:
           True if the header has all required fields, False otherwise
         """
+        # hash the header once so each required-field check is O(1)
+        # instead of a scan of the header list
+        header_set = set(header)
         valid = True
         for h in self.REQUIRED_HEADERS:
-            if h not in header:
+            if h not in header_set:
                 # in the case of the enrollment form, packet is
                 # set to None and allowed to be missing
                 if h == "packet" and self.__key.packet is None:
                     continue
 
                 if not self.__key.ignore_headers:
-                    log.error(f"Missing expected header: {h}")
+                    log.error("Missing expected header: %s", h)
                     valid = False
                 else:
                     log.warning(
-                        f"Missing expected header: {h}, but ignoring "
-                        + f"headers for {self.__key.module}"
+                        "Missing expected header: %s, but ignoring headers for %s",
+                        h,
+                        self.__key.module,
                     )
 
+        # project each row onto the required fields actually in the
+        # file, so visit_row does not reconsider absent columns
+        self.__upload_fields = tuple(
+            h for h in self.REQUIRED_HEADERS if h in header_set
+        )
+
         return valid
 
     def log_row_error(self, line_num: int, field: str, msg: str) -> bool:
@@ -82,65 +145,125 @@ class ErrorCheckCSVVisitor:
         Returns:
             False
         """
-        log.error(f"Row {line_num}: Field {field} {msg}")
+        log.error("Row %s: Field %s %s", line_num, field, msg)
         return False
 
-    def visit_row(self, row: Dict[str, Any], line_num: int) -> bool:
-        """Visit the dictionary for a row (per DictReader). Ensure the row
-        matches the expected form/packet and fields and data is filled for all
-        files.
+    def __check_empty_fields(self, row: Dict[str, Any], line_num: int) -> bool:
+        """Checks that all required fields in the row are filled.
 
         Args:
           row: the dictionary for a row from a CSV file
           line_num: The line number of the row
         Returns:
-          True if the row was processed without error, False otherwise
+          True if all required fields are filled, False otherwise
         """
         valid = True
-        for field, value in row.items():
-            if (
-                not value
-                and field not in self.ALLOWED_EMPTY_FIELDS
-                and field in self.REQUIRED_HEADERS
-            ):
+        # only the required fields from the header need checking, so
+        # skip any extra columns carried on the row
+        for field in self.__upload_fields:
+            if not row.get(field) and field not in self.ALLOWED_EMPTY_FIELDS_SET:
                 valid = self.log_row_error(line_num, field, "cannot be empty")
+                if self.__fail_fast:
+                    return False
+
+        return valid
 
+    def __check_error_code(self, row: Dict[str, Any], line_num: int) -> bool:
+        """Checks the form name and error code match the key.
+
+        Args:
+          row: the dictionary for a row from a CSV file
+          line_num: The line number of the row
+        Returns:
+          True if the form name and error code are consistent,
+          False otherwise
+        """
+        valid = True
         form_name = row.get("form_name", "")
-        if form_name != self.__key.form_name:
+        if form_name != self.__form_name:
             valid = self.log_row_error(
                 line_num,
-                field,
-                f"does not match expected form name {self.__key.form_name}",
+                "form_name",
+                f"does not match expected form name {self.__form_name}",
             )
+            if self.__fail_fast:
+                return False
 
         error_code = row.get("error_code", "")
-        if not error_code.startswith(self.__key.form_name):
+        if error_code[: self.__form_name_len] != self.__form_name:
             valid = self.log_row_error(
                 line_num,
-                field,
-                f"does not start with expected form name {self.__key.form_name}",
+                "error_code",
+                f"does not start with expected form name {self.__form_name}",
             )
+            if self.__fail_fast:
+                return False
+
+        return valid
+
+    def __check_packet(self, row: Dict[str, Any], line_num: int) -> bool:
+        """Checks the packet and visit type are consistent with the key.
+
+        Args:
+          row: the dictionary for a row from a CSV file
+          line_num: The line number of the row
+        Returns:
+          True if the packet is consistent, False otherwise
+        """
+        valid = True
+        visit_type = self.__visit_type
+        if visit_type and visit_type not in row.get("error_code", ""):
+            valid = self.log_row_error(
+                line_num,
+                "error_code",
+                f"does not have expected visit type {visit_type}",
+            )
+            if self.__fail_fast:
+                return False
+
+        packet = row.get("packet", "")
+        if packet != self.__packet:
+            valid = self.log_row_error(
+                line_num,
+                "packet",
+                f"does not match expected packet {self.__packet}",
+            )
+            if self.__fail_fast:
+                return False
+
+        return valid
+
+    def visit_row(self, row: Dict[str, Any], line_num: int) -> bool:
+        """Visit the dictionary for a row. Ensure the row matches the expected
+        form/packet and fields and data is filled for all files.
+
+        Args:
+          row: the dictionary for a row from a CSV file
+          line_num: The line number of the row
+        Returns:
+          True if the row was processed without error, False otherwise
+        """
+        valid = self.__check_empty_fields(row, line_num)
+        if not valid and self.__fail_fast:
+            return False
+
+        valid = self.__check_error_code(row, line_num) and valid
+        if not valid and self.__fail_fast:
+            return False
 
         # check packet is consistent
-        if self.__key.packet:
-            visit_type = self.__key.get_visit_type()
-            if visit_type and visit_type not in error_code:
-                valid = self.log_row_error(
-                    line_num, field, f"does not have expected visit type {visit_type}"
-                )
-
-            packet = row.get("packet", "")
-            if packet != self.__key.packet:
-                valid = self.log_row_error(
-                    line_num,
-                    field,
-                    f"does not match expected packet {self.__key.packet}",
-                )
+        if self.__packet:
+            valid = self.__check_packet(row, line_num) and valid
+            if not valid and self.__fail_fast:
+                return False
 
         # only import items in REQUIRED_HEADERS if valid
         if valid:
+            common = _COMMON_VALUES
             upload_row = {
-                field: row[field] for field in self.REQUIRED_HEADERS if field in row
+                field: common.get(row[field], row[field])
+                for field in self.__upload_fields
+                if field in row
             }
             self.__validated_error_checks.append(upload_row)
 
@@ -159,29 +282,47 @@ def read_csv(
     Returns:
       True if the input file was processed without error, False otherwise
     """
-    csv_sample = input_file.read(1024)
-    if not csv_sample:
+    csv_reader = reader(input_file, delimiter=delimiter)
+    try:
+        fieldnames = next(csv_reader)
+    except StopIteration:
         log.error("CSV file is empty")
         return False
 
-    input_file.seek(0)
-
-    reader = DictReader(input_file, delimiter=delimiter)
-    if not reader.fieldnames:
+    if not fieldnames:
         log.error("CSV has no headers")
         return False
 
     # visitor should handle errors for invalid headers/rows
-    success = visitor.visit_header(list(reader.fieldnames))
+    success = visitor.visit_header(fieldnames)
     if not success:
         return False
 
+    # precompute the column index of each required header once so each
+    # row only allocates the dict restricted to the required fields,
+    # instead of a full DictReader dict plus a filtered copy
+    field_indices = [
+        (field, fieldnames.index(field))
+        for field in visitor.REQUIRED_HEADERS
+        if field in fieldnames
+    ]
+
+    # bind the loop invariants locally to avoid per-row attribute
+    # lookups in the hot loop
+    visit_row = visitor.visit_row
+    fail_fast = visitor.fail_fast
     try:
-        for record in reader:
-            row_success = visitor.visit_row(record, line_num=reader.line_num)
+        for row in csv_reader:
+            record = {
+                field: (row[index] if index < len(row) else None)
+                for field, index in field_indices
+            }
+            row_success = visit_row(record, line_num=csv_reader.line_num)
             success = row_success and success
+            if not row_success and fail_fast:
+                return False
     except Error as error:
-        log.error(f"Encountered error reading CSV: {error}")
+        log.error("Encountered error reading CSV: %s", error)
         return False
 
     return success
@@ -89,3 +89,12 @@ class TestErrorCheckImportStats:
             assert stats.add_error_codes([code]) == [code]
 
         assert len(stats.all_error_codes) == 20
+
+    def test_add_error_codes_duplicates_within_batch(self, stats):
+        """Test that codes repeated within a single batch are reported."""
+        assert stats.add_error_codes(["a", "b", "a"]) == ["a"]
+        assert len(stats.all_error_codes) == 3
+
+        # codes from earlier batches are still reported as duplicates
+        assert stats.add_error_codes(["b", "c"]) == ["b"]
+        assert len(stats.all_error_codes) == 5
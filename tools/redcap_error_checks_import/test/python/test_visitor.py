@@ -144,6 +144,35 @@ class TestErrorCheckCSVVisitor:
             }
         ]
 
+    def test_visit_row_fail_fast(self, data, caplog):
+        """Test that a fail-fast visitor stops at the first row error while the
+        default visitor reports every problem."""
+        key = ErrorCheckKey.create_from_key(
+            "CSV/module/1.0/dummy_packet/form_dummy_error_checks.csv"
+        )
+        # empty required fields plus a mismatched form name and packet
+        bad_row = dict(data)
+        bad_row["var_name"] = ""
+        bad_row["form_name"] = "other"
+        bad_row["packet"] = "other_packet"
+
+        default_visitor = ErrorCheckCSVVisitor(key=key)
+        assert default_visitor.visit_header(list(default_visitor.REQUIRED_HEADERS))
+        with caplog.at_level("ERROR"):
+            assert not default_visitor.visit_row(bad_row, 1)
+        default_errors = len(caplog.records)
+        assert default_errors > 1
+
+        caplog.clear()
+        fail_fast_visitor = ErrorCheckCSVVisitor(key=key, fail_fast=True)
+        assert fail_fast_visitor.visit_header(list(fail_fast_visitor.REQUIRED_HEADERS))
+        with caplog.at_level("ERROR"):
+            assert not fail_fast_visitor.visit_row(bad_row, 1)
+        assert len(caplog.records) == 1
+
+        assert not default_visitor.validated_error_checks
+        assert not fail_fast_visitor.validated_error_checks
+
     def test_visit_header_form(self):
         """Test visiting header form, which is mostly the same but form_name
         needs the module prepended."""